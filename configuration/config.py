@@ -20,3 +20,6 @@ class Config:
 
     AUTOSCOUT_THREAD_COUNT = int(os.getenv('AUTOSCOUT_THREAD_COUNT'))
     MOBILE_THREAD_COUNT = int(os.getenv('MOBILE_THREAD_COUNT'))
+
+    # Complete scrapers only: drop the secondary indexes for the run and rebuild them at the end
+    BULK_LOAD = os.getenv('BULK_LOAD', '').lower() in ('1', 'true', 'yes')
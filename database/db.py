@@ -1,10 +1,146 @@
 import psycopg2
-from psycopg2 import pool, sql
+from psycopg2 import pool, sql, extras
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+from psycopg2.errors import UniqueViolation
 import threading
-from typing import Dict, Any
+import atexit
+import io
+import orjson
+from typing import Dict, Any, List
 from configuration.config import Config
 from datetime import datetime
 import time
+import struct
+import hashlib
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Decode JSON/JSONB results with orjson instead of the stdlib json module
+extras.register_default_json(loads=orjson.loads, globally=True)
+extras.register_default_jsonb(loads=orjson.loads, globally=True)
+
+
+def _json_dumps(value) -> str:
+    return orjson.dumps(value).decode('utf-8')
+
+
+# Marker files recording that the database / schema DDL already ran; younger than the TTL means skip it
+STARTUP_CACHE_DIR = Path.home() / ".cache" / "vehicle_db"
+STARTUP_CACHE_TTL = 24 * 60 * 60
+
+
+def _startup_marker(name: str) -> Path:
+    return STARTUP_CACHE_DIR / f"{name}.ok"
+
+
+def _startup_marker_fresh(marker: Path) -> bool:
+    try:
+        return time.time() - marker.stat().st_mtime < STARTUP_CACHE_TTL
+    except OSError:
+        return False
+
+
+def _touch_startup_marker(marker: Path):
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        # Read-only home: initialization simply runs again next start
+        pass
+
+
+def _relkind(cursor, schema_name: str, table_name: str) -> str | None:
+    """pg_class.relkind of schema_name.table_name ('r' plain table, 'p' partitioned), or None if it doesn't exist."""
+    cursor.execute(
+        "SELECT c.relkind FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+        "WHERE n.nspname = %s AND c.relname = %s",
+        (schema_name, table_name)
+    )
+    found = cursor.fetchone()
+    return found[0] if found else None
+
+
+# Session settings for every pooled connection, tuned for re-runnable bulk ingestion: a crash may lose
+# the last few hundred milliseconds of commits, which the next scrape simply re-inserts
+SESSION_OPTIONS = "-c synchronous_commit=off -c jit=off -c work_mem=64MB -c client_min_messages=warning"
+
+
+@cache
+def _get_pool(host, port, database_name, user, password) -> pool.ThreadedConnectionPool:
+    """One shared connection pool per server/database/credentials, created on first use."""
+    return pool.ThreadedConnectionPool(
+        minconn=1,
+        maxconn=50,
+        dbname=database_name,
+        user=user,
+        password=password,
+        host=host,
+        port=port,
+        options=SESSION_OPTIONS
+    )
+
+
+# PostgreSQL binary COPY framing: signature + flags + header extension length, and the end-of-data marker
+COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+COPY_BINARY_TRAILER = struct.pack('>h', -1)
+_COPY_NULL = struct.pack('>i', -1)
+_pack_int32 = struct.Struct('>i').pack
+
+
+def _copy_text(value) -> bytes:
+    """
+    Binary COPY field for TEXT/ENUM columns: length-prefixed UTF-8, matching what the INSERT path stores
+    (booleans as true/false). Lists/dicts are rejected, as psycopg2 can't bind them to a TEXT column either.
+    """
+    if value is None:
+        return _COPY_NULL
+    if value is True:
+        data = b'true'
+    elif value is False:
+        data = b'false'
+    elif isinstance(value, (list, dict)):
+        raise TypeError(f"cannot store {type(value).__name__} in a TEXT column")
+    else:
+        data = (value if isinstance(value, str) else str(value)).encode('utf-8')
+    return _pack_int32(len(data)) + data
+
+
+def _copy_jsonb(value) -> bytes:
+    """Binary COPY field for JSONB columns: version byte 1 followed by the JSON text."""
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (dict, list)):
+        data = orjson.dumps(value)
+    else:
+        data = (value if isinstance(value, str) else str(value)).encode('utf-8')
+    return _pack_int32(len(data) + 1) + b'\x01' + data
+
+
+def _copy_varbit(value) -> bytes:
+    """Binary COPY field for BIT VARYING columns given as a '0'/'1' string: bit count + packed bits."""
+    if value is None:
+        return _COPY_NULL
+    nbits = len(value)
+    nbytes = (nbits + 7) // 8
+    bits = (int(value, 2) << (nbytes * 8 - nbits)).to_bytes(nbytes, 'big') if nbits else b''
+    return _pack_int32(nbytes + 4) + _pack_int32(nbits) + bits
+
+
+def _compile_copy_serializer(columns: tuple, encoders: Dict[str, str]):
+    """
+    Generate serialize(row, buf) for a fixed column order: the column loop is unrolled into one
+    expression with literal keys and per-column encoders, and the binary COPY tuple is appended to
+    the bytearray buf. encoders maps column -> encoder name (default _copy_text).
+    """
+    fields = "".join(f"        {encoders.get(col, '_copy_text')}(d.get({col!r})),\n" for col in columns)
+    src = f"def serialize(d, buf):\n    buf += {struct.pack('>h', len(columns))!r}\n" \
+          f"    buf += b''.join((\n{fields}    ))\n"
+    namespace = {'_copy_text': _copy_text, '_copy_jsonb': _copy_jsonb, '_copy_varbit': _copy_varbit}
+    exec(compile(src, f"<copy serializer: {len(columns)} columns>", "exec"), namespace)
+    return namespace['serialize']
+
 
 class VehicleDatabase:
     """
@@ -12,9 +148,6 @@ class VehicleDatabase:
     Handles schema/table creation and provides insertion with duplicate checking.
     """
 
-    _lock = threading.Lock()
-    _connection_pools = {}
-
     host = Config.DATABASE_HOST
     port = Config.DATABASE_PORT
     user = Config.DATABASE_USER
@@ -98,6 +231,34 @@ class VehicleDatabase:
                     'right_hand_drive', 'taxi', 'disabled_accessible', 'smoker_package', 'leather_interior',
                     'paddle_shifters']
 
+    # Low-cardinality text columns stored as ENUM types (<column>_enum); labels are added as values appear
+    ENUM_COLUMNS = ('vehicle_type', 'category', 'body_type', 'fuel_type', 'fuel_category', 'primary_fuel',
+                    'transmission', 'transmission_type', 'drive_train', 'emission_sticker', 'emission_standard',
+                    'co2_class', 'offer_type', 'condition', 'color', 'paint_type', 'upholstery', 'country_code')
+    ENUM_LABEL_MAX_BYTES = 63
+
+    # Membership sets and quoted identifiers, built once at class load
+    STRING_SET = frozenset(STRING_COLUMNS)
+    VALID_COLUMNS = STRING_SET | {'features', 'scraped_at', 'updated_at', 'is_vehicle_available'}
+    COL_IDENT = {col: sql.Identifier(col) for col in VALID_COLUMNS}
+
+    # Fixed column order used by the COPY bulk path; rows with other columns are inserted with execute_values
+    COPY_COLUMNS = (*STRING_COLUMNS, 'features')
+    COPY_SET = frozenset(COPY_COLUMNS)
+    # JSONB columns; list/dict values are serialized by the insert paths
+    JSON_COLUMNS = frozenset({'images'})
+    # Binary COPY encoder per non-text column
+    COPY_ENCODERS = {**dict.fromkeys(JSON_COLUMNS, '_copy_jsonb'), 'features': '_copy_varbit'}
+
+    # Secondary btree indexes (idx_<table>_<column>); the primary key is not listed here
+    INDEXED_COLUMNS = ('data_source', 'listing_url', 'created_at', 'updated_at', 'scraped_at', 'is_vehicle_available')
+
+    # LIST partitions of the table by data_source (<table>_<source>); other sources go to <table>_default
+    PARTITIONS = ('autoscout24', 'mobile')
+
+    # Rows buffered by insert_vehicle before they are flushed with COPY
+    BATCH_SIZE = 1000
+
     def __init__(self, logger, schema_name: str = "vehicle_marketplace", table_name: str = "vehicle_data"):
         self.log = logger
         self.schema_name = schema_name
@@ -105,32 +266,58 @@ class VehicleDatabase:
 
         self.log.info(f"Initializing VehicleDatabase for schema: {schema_name}, table: {table_name}")
 
-        pool_key = f"{self.host}:{self.port}:{self.database_name}"
+        try:
+            self.connection_pool = _get_pool(self.host, self.port, self.database_name, self.user, self.password)
+        except Exception as e:
+            self.log.error(f"ERROR: Failed to create connection pool: {e}")
+            raise
+        # Each thread keeps one pooled connection checked out for its lifetime
+        self._tls = threading.local()
+        self._thread_connections = {}
+        self._connections_lock = threading.Lock()
+        atexit.register(self._release_connections)
+        self._insert_buffer = []
+        # vehicle_ids whose updated_at is refreshed on the next flush: {data_source: {vehicle_id, ...}}
+        self._touch_buffer: Dict[str, set] = {}
+        self._touch_count = 0
+        self._buffer_lock = threading.Lock()
+        # Known ENUM labels per column, loaded from pg_enum on first use
+        self._enum_labels: Dict[str, set] | None = None
+        self._enum_lock = threading.Lock()
+        # INSERT statement text per column set: {frozenset(columns): (ordered columns, query text)}
+        self._query_cache: Dict[frozenset, tuple] = {}
+        # Row -> binary COPY tuple encoder specialised for COPY_COLUMNS
+        self._serialize_copy_row = _compile_copy_serializer(self.COPY_COLUMNS, self.COPY_ENCODERS)
 
-        with self._lock:
-            if pool_key not in self._connection_pools:
-                try:
-                    self.log.info(f"Creating new connection pool for {pool_key}")
-                    self._connection_pools[pool_key] = pool.ThreadedConnectionPool(
-                        minconn=1,
-                        maxconn=50,
-                        dbname=self.database_name,
-                        user=self.user,
-                        password=self.password,
-                        host=self.host,
-                        port=self.port
-                    )
-                    self.log.info("Connection pool created successfully")
-                except Exception as e:
-                    self.log.error(f"ERROR: Failed to create connection pool: {e}")
-                    raise
+        # Keyed by server and by the schema definition, so another server or a code change re-runs the DDL
+        marker = _startup_marker(f"{self.host}_{self.port}_{self.database_name}_{schema_name}_{table_name}_"
+                                 f"{self._schema_fingerprint()}")
+        if _startup_marker_fresh(marker) and self._table_exists():
+            self.log.info(f"Skipping database initialization, '{schema_name}.{table_name}' verified recently")
+        else:
+            self._initialize_database()
+            _touch_startup_marker(marker)
 
-        self.connection_pool = self._connection_pools[pool_key]
-        self._initialize_database()
+    @classmethod
+    def _schema_fingerprint(cls) -> str:
+        """Short hash of everything the startup DDL is built from (columns, enums, indexes, partitions)."""
+        ddl_inputs = (cls.STRING_COLUMNS, cls.BOOL_COLUMNS, cls.ENUM_COLUMNS, sorted(cls.JSON_COLUMNS),
+                      cls.INDEXED_COLUMNS, cls.PARTITIONS)
+        return hashlib.sha1(repr(ddl_inputs).encode('utf-8')).hexdigest()[:12]
+
+    def _table_exists(self) -> bool:
+        """Cheap check that the table is still there (the database may have been dropped and recreated)."""
+        conn = self._get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT to_regclass(%s)", (f'"{self.schema_name}"."{self.table_name}"',))
+                return cursor.fetchone()[0] is not None
+        finally:
+            self._put_connection(conn)
 
     def _get_connection(self, retries=3, backoff=2):
         """
-        Attempt to get a connection from the pool with retry logic.
+        Return the calling thread's persistent connection, checking one out of the pool on first use.
 
         Args:
             retries (int): Number of retry attempts.
@@ -139,11 +326,22 @@ class VehicleDatabase:
         Returns:
             connection (psycopg2.extensions.connection): A valid database connection.
         """
+        conn = getattr(self._tls, 'conn', None)
+        if conn is not None and not conn.closed:
+            return conn
+
+        # Hand connections held by finished threads back to the pool before taking a new one
+        self._reclaim_connections()
+
         attempt = 0
         while attempt < retries:
             try:
                 # Try to get a connection from the pool
-                return self.connection_pool.getconn()
+                conn = self.connection_pool.getconn()
+                self._tls.conn = conn
+                with self._connections_lock:
+                    self._thread_connections[threading.current_thread()] = conn
+                return conn
             except Exception as e:
                 attempt += 1
                 self.log.error(f"ERROR: Failed to get connection from pool (attempt {attempt}/{retries}): {e}")
@@ -158,13 +356,51 @@ class VehicleDatabase:
                     time.sleep(backoff)
 
     def _put_connection(self, conn):
+        """Finish the current unit of work; the connection stays checked out by this thread."""
         try:
-            self.connection_pool.putconn(conn)
+            status = conn.info.transaction_status if not conn.closed else TRANSACTION_STATUS_UNKNOWN
+            if status == TRANSACTION_STATUS_UNKNOWN:
+                # Broken connection: drop it so the next call checks out a fresh one
+                self._tls.conn = None
+                with self._connections_lock:
+                    self._thread_connections.pop(threading.current_thread(), None)
+                self.connection_pool.putconn(conn, close=True)
+            elif status != TRANSACTION_STATUS_IDLE:
+                # Don't leave read-only work idle in transaction
+                conn.rollback()
         except Exception as e:
             self.log.error(f"ERROR: Failed to return connection to pool: {e}")
 
+    def _reclaim_connections(self):
+        """Return connections owned by threads that are no longer alive."""
+        with self._connections_lock:
+            dead = [thread for thread in self._thread_connections if not thread.is_alive()]
+            for thread in dead:
+                conn = self._thread_connections.pop(thread)
+                try:
+                    self.connection_pool.putconn(conn)
+                except Exception as e:
+                    self.log.error(f"ERROR: Failed to return connection to pool: {e}")
+
+    def _release_connections(self):
+        """Return every thread-held connection to the pool (registered with atexit)."""
+        with self._connections_lock:
+            connections = list(self._thread_connections.values())
+            self._thread_connections.clear()
+        for conn in connections:
+            try:
+                self.connection_pool.putconn(conn)
+            except Exception as e:
+                self.log.error(f"ERROR: Failed to return connection to pool: {e}")
+
     def _initialize_database(self):
+        # Serialize the DDL across processes starting at the same time. The lock is session-level and
+        # this thread's pinned connection is reused by the DDL methods, so it is held until released below.
+        lock_key = f"{self.schema_name}.{self.table_name}"
+        conn = self._get_connection()
         try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", (lock_key,))
             self.check_schema_exist()
             self.create_table_if_not_exists()
             self.create_indexes()
@@ -172,6 +408,13 @@ class VehicleDatabase:
         except Exception as e:
             self.log.error(f"ERROR: Database initialization failed: {e}")
             raise
+        finally:
+            if not conn.closed:
+                conn.rollback()
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(hashtext(%s))", (lock_key,))
+                conn.commit()
+            self._put_connection(conn)
 
     def check_schema_exist(self):
         conn = None
@@ -209,12 +452,35 @@ class VehicleDatabase:
             conn = self._get_connection()
             cursor = conn.cursor()
 
+            # A table from the old layout (unique_id key, one BOOLEAN column per feature) is a plain table;
+            # CREATE TABLE IF NOT EXISTS would keep it and the partition DDL below would fail on it
+            relkind = _relkind(cursor, self.schema_name, self.table_name)
+            if relkind is not None and relkind != 'p':
+                raise RuntimeError(
+                    f"'{self.schema_name}.{self.table_name}' uses the old unpartitioned layout; "
+                    f"migrate it with 'python -m database.migrate_legacy' (see README)"
+                )
+
+            # ENUM types must exist before the table that uses them
+            cursor.execute(
+                "SELECT t.typname FROM pg_type t JOIN pg_namespace n ON n.oid = t.typnamespace "
+                "WHERE n.nspname = %s AND t.typtype = 'e'",
+                (self.schema_name,)
+            )
+            existing_types = {row[0] for row in cursor.fetchall()}
+            for col in self.ENUM_COLUMNS:
+                if f"{col}_enum" not in existing_types:
+                    cursor.execute(sql.SQL("CREATE TYPE {}.{} AS ENUM ()").format(
+                        sql.Identifier(self.schema_name),
+                        sql.Identifier(f"{col}_enum")
+                    ))
+
             columns = [
-                "unique_id VARCHAR(500) PRIMARY KEY NOT NULL",
-                "vehicle_id VARCHAR(255) NOT NULL",
-                "data_source VARCHAR(255) NOT NULL",
-                "listing_url VARCHAR(255) NOT NULL",
-                "images JSON",
+                "vehicle_id TEXT NOT NULL",
+                "data_source TEXT NOT NULL",
+                # Bounded because it is btree-indexed (index entries are limited to ~2.7kB)
+                "listing_url TEXT NOT NULL CHECK (char_length(listing_url) <= 2048)",
+                "images JSONB",
                 # timestamps
                 "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
                 "scraped_at DATE NOT NULL DEFAULT CURRENT_DATE",
@@ -225,24 +491,80 @@ class VehicleDatabase:
 
             # Add string columns (nullable)
             for col in self.STRING_COLUMNS:
-                if col not in ['vehicle_id', 'data_source', 'listing_url', 'images']:
+                if col in self.ENUM_COLUMNS:
+                    columns.append(sql.SQL("{} {}.{}").format(
+                        sql.Identifier(col),
+                        sql.Identifier(self.schema_name),
+                        sql.Identifier(f"{col}_enum")
+                    ))
+                elif col not in ['vehicle_id', 'data_source', 'listing_url', 'images']:
                     columns.append(f"{col} TEXT")
 
-            # Add boolean columns (nullable)
-            for col in self.BOOL_COLUMNS:
-                columns.append(f"{col} BOOLEAN")
+            # Boolean features packed into one bitmap, bit i = BOOL_COLUMNS[i] (append-only order)
+            columns.append("features BIT VARYING")
+
+            # Natural composite key (also serves vehicle_id lookups)
+            columns.append("PRIMARY KEY (vehicle_id, data_source)")
 
             create_table_query = sql.SQL("""
                 CREATE TABLE IF NOT EXISTS {}.{} (
                     {}
-                )
+                ) PARTITION BY LIST (data_source)
             """).format(
                 sql.Identifier(self.schema_name),
                 sql.Identifier(self.table_name),
-                sql.SQL(',\n                    ').join(map(sql.SQL, columns))
+                sql.SQL(',\n                    ').join(
+                    col if isinstance(col, sql.Composable) else sql.SQL(col) for col in columns
+                )
             )
 
             cursor.execute(create_table_query)
+
+            # One partition per scraper source so bulk loads can COPY into them in parallel
+            for source in self.PARTITIONS:
+                cursor.execute(sql.SQL("CREATE TABLE IF NOT EXISTS {}.{} PARTITION OF {}.{} FOR VALUES IN ({})").format(
+                    sql.Identifier(self.schema_name),
+                    sql.Identifier(self._partition_name(source)),
+                    sql.Identifier(self.schema_name),
+                    sql.Identifier(self.table_name),
+                    sql.Literal(source)
+                ))
+            cursor.execute(sql.SQL("CREATE TABLE IF NOT EXISTS {}.{} PARTITION OF {}.{} DEFAULT").format(
+                sql.Identifier(self.schema_name),
+                sql.Identifier(f"{self.table_name}_default"),
+                sql.Identifier(self.schema_name),
+                sql.Identifier(self.table_name)
+            ))
+
+            # LZ4 TOAST compression (PostgreSQL 14+) is much cheaper than pglz for the image URL lists
+            if conn.server_version >= 140000:
+                cursor.execute("SAVEPOINT images_compression")
+                try:
+                    cursor.execute(sql.SQL("ALTER TABLE {}.{} ALTER COLUMN images SET COMPRESSION lz4").format(
+                        sql.Identifier(self.schema_name),
+                        sql.Identifier(self.table_name)
+                    ))
+                except psycopg2.Error as e:
+                    # Server built without lz4: keep the default compression
+                    cursor.execute("ROLLBACK TO SAVEPOINT images_compression")
+                    self.log.warning(f"Could not enable lz4 compression for images: {e}")
+
+            # View exposing the packed features as the named boolean columns; rows written before a column was
+            # appended to BOOL_COLUMNS have a shorter bitmap and show NULL for it
+            create_view_query = sql.SQL("CREATE OR REPLACE VIEW {}.{} AS SELECT t.*, {} FROM {}.{} t").format(
+                sql.Identifier(self.schema_name),
+                sql.Identifier(f"{self.table_name}_view"),
+                sql.SQL(', ').join(
+                    sql.SQL("CASE WHEN length(t.features) > {} THEN get_bit(t.features, {}) = 1 END AS {}").format(
+                        sql.Literal(i), sql.Literal(i), sql.Identifier(col)
+                    )
+                    for i, col in enumerate(self.BOOL_COLUMNS)
+                ),
+                sql.Identifier(self.schema_name),
+                sql.Identifier(self.table_name)
+            )
+            cursor.execute(create_view_query)
+
             conn.commit()
             self.log.info(f"Table '{self.schema_name}.{self.table_name}' checked/created successfully")
 
@@ -257,6 +579,54 @@ class VehicleDatabase:
             if conn:
                 self._put_connection(conn)
 
+    def _partition_name(self, data_source: str) -> str:
+        """Child table holding the rows of data_source (the parent table for unknown sources)."""
+        if data_source in self.PARTITIONS:
+            return f"{self.table_name}_{data_source}"
+        return self.table_name
+
+    def _index_name(self, column: str) -> str:
+        return f"idx_{self.table_name}_{column}"
+
+    @contextmanager
+    def bulk_load_context(self):
+        """
+        Drop the secondary indexes for the duration of a large bulk load and rebuild them afterwards,
+        so the load only maintains the primary key and each index is built once with a sort.
+        The indexes are recreated even if the load fails.
+        """
+        conn = None
+        cursor = None
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            # Partitioned indexes cannot be dropped CONCURRENTLY; a plain DROP only takes a brief lock
+            cursor.execute(sql.SQL(";\n").join(
+                sql.SQL("DROP INDEX IF EXISTS {}.{}").format(
+                    sql.Identifier(self.schema_name),
+                    sql.Identifier(self._index_name(col))
+                )
+                for col in self.INDEXED_COLUMNS
+            ))
+            conn.commit()
+            self.log.info(f"Dropped secondary indexes on '{self.schema_name}.{self.table_name}' for bulk load")
+        except Exception as e:
+            self.log.error(f"ERROR: Failed to drop indexes: {e}")
+            if conn:
+                conn.rollback()
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                self._put_connection(conn)
+
+        try:
+            yield self
+        finally:
+            self.flush()
+            self.create_indexes()
+
     def create_indexes(self):
         """Create indexes on important columns (including updated_at, scraped_at, availability)."""
         conn = None
@@ -266,45 +636,17 @@ class VehicleDatabase:
             cursor = conn.cursor()
 
             index_queries = [
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_vehicle_id ON {}.{} (vehicle_id)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_data_source ON {}.{} (data_source)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_listing_url ON {}.{} (listing_url)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_created_at ON {}.{} (created_at)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_updated_at ON {}.{} (updated_at)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_scraped_at ON {}.{} (scraped_at)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
-                sql.SQL(
-                    "CREATE INDEX IF NOT EXISTS idx_{}_is_vehicle_available ON {}.{} (is_vehicle_available)"
-                ).format(sql.SQL(self.table_name),
-                         sql.Identifier(self.schema_name),
-                         sql.Identifier(self.table_name)),
+                sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {}.{} ({})").format(
+                    sql.Identifier(self._index_name(col)),
+                    sql.Identifier(self.schema_name),
+                    sql.Identifier(self.table_name),
+                    sql.Identifier(col)
+                )
+                for col in self.INDEXED_COLUMNS
             ]
 
-            for query in index_queries:
-                cursor.execute(query)
+            # Send all index statements in a single round-trip
+            cursor.execute(sql.SQL(";\n").join(index_queries))
 
             conn.commit()
             self.log.info("✅ Indexes created successfully")
@@ -320,25 +662,24 @@ class VehicleDatabase:
             if conn:
                 self._put_connection(conn)
 
-    def generate_unique_id(self, vehicle_id: str, data_source: str) -> str:
-        return f"{vehicle_id}_{data_source}"
-
     def check_id_exists(self, vehicle_id: str, data_source: str) -> bool:
-        """Pure existence check—no side effects."""
+        """
+        Pure existence check—no side effects.
+        Debug helper only: the insert paths dedupe server-side with ON CONFLICT DO NOTHING.
+        """
         conn = None
         cursor = None
         try:
-            unique_id = self.generate_unique_id(vehicle_id, data_source)
             conn = self._get_connection()
             cursor = conn.cursor()
-            query = sql.SQL("SELECT 1 FROM {}.{} WHERE unique_id = %s LIMIT 1").format(
+            query = sql.SQL("SELECT 1 FROM {}.{} WHERE vehicle_id = %s AND data_source = %s LIMIT 1").format(
                 sql.Identifier(self.schema_name),
                 sql.Identifier(self.table_name)
             )
-            cursor.execute(query, (unique_id,))
+            cursor.execute(query, (str(vehicle_id), data_source))
             return cursor.fetchone() is not None
         except Exception as e:
-            self.log.info(f"ERROR: Failed to check if ID exists: {e}")
+            self.log.error(f"ERROR: Failed to check if ID exists: {e}")
             raise
         finally:
             if cursor:
@@ -346,118 +687,406 @@ class VehicleDatabase:
             if conn:
                 self._put_connection(conn)
 
-    def insert_vehicle(self, data: Dict[str, Any]) -> bool:
+    def existing_ids(self, vehicle_ids: List[str], data_source: str) -> set:
         """
-        Insert a vehicle record.
-        Ensures scraped_at, updated_at default to CURRENT_DATE and is_vehicle_available defaults to TRUE.
+        Return the subset of vehicle_ids already stored for data_source, in one query.
+        Lets callers skip a whole page of known listings before fetching their details.
         """
+        ids = list({str(vehicle_id) for vehicle_id in vehicle_ids if vehicle_id})
+        if not ids:
+            return set()
+
         conn = None
         cursor = None
         try:
-            # Validate required fields
-            if 'vehicle_id' not in data or 'data_source' not in data:
-                self.log.info("ERROR: 'vehicle_id' and 'data_source' are required fields")
-                return False
-            if not data['vehicle_id'] or not data['data_source']:
-                self.log.info("ERROR: 'vehicle_id' and 'data_source' cannot be empty")
-                return False
-
-            unique_id = self.generate_unique_id(data['vehicle_id'], data['data_source'])
-
             conn = self._get_connection()
             cursor = conn.cursor()
+            query = sql.SQL("SELECT vehicle_id FROM {}.{} WHERE data_source = %s AND vehicle_id = ANY(%s)").format(
+                sql.Identifier(self.schema_name),
+                sql.Identifier(self.table_name)
+            )
+            cursor.execute(query, (data_source, ids))
+            return {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            self.log.error(f"ERROR: Failed to look up existing IDs: {e}")
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                self._put_connection(conn)
 
-            # Prepare data for insertion
-            insert_data = {'unique_id': unique_id}
-            insert_data.update(data)
+    def insert_vehicle(self, data: Dict[str, Any]) -> bool:
+        """
+        Queue a vehicle record for insertion.
+        Rows are buffered and written with COPY once BATCH_SIZE is reached, or on flush()/close().
+        scraped_at, updated_at and is_vehicle_available fall back to the table defaults when absent.
+        Returns True if the record was queued.
+        """
+        # Validate required fields
+        if 'vehicle_id' not in data or 'data_source' not in data:
+            self.log.error("ERROR: 'vehicle_id' and 'data_source' are required fields")
+            return False
+        if not data['vehicle_id'] or not data['data_source']:
+            self.log.error("ERROR: 'vehicle_id' and 'data_source' cannot be empty")
+            return False
 
-            # Valid columns + date stamps + availability
-            valid_columns = (
-                ['unique_id', 'vehicle_id', 'data_source', 'listing_url', 'images'] +
-                [col for col in self.STRING_COLUMNS if col not in ['vehicle_id', 'data_source', 'listing_url', 'images']] +
-                self.BOOL_COLUMNS +
-                ['scraped_at', 'updated_at', 'is_vehicle_available']
-            )
+        batch = None
+        with self._buffer_lock:
+            self._insert_buffer.append(self._prepare_row(data))
+            if len(self._insert_buffer) >= self.BATCH_SIZE:
+                batch, self._insert_buffer = self._insert_buffer, []
 
-            filtered_data = {k: v for k, v in insert_data.items() if k in valid_columns}
-
-            # Build columns, injecting CURRENT_DATE / TRUE if absent
-            columns = list(filtered_data.keys())
-            if 'scraped_at' not in columns:
-                columns.append('scraped_at')
-            if 'updated_at' not in columns:
-                columns.append('updated_at')
-            if 'is_vehicle_available' not in columns:
-                columns.append('is_vehicle_available')
-
-            placeholders = []
-            values = []
-            for col in columns:
-                if col in ('scraped_at', 'updated_at') and col not in filtered_data:
-                    placeholders.append(sql.SQL('CURRENT_DATE'))  # DATE only
-                elif col == 'is_vehicle_available' and col not in filtered_data:
-                    placeholders.append(sql.SQL('TRUE'))
-                else:
-                    placeholders.append(sql.Placeholder())
-                    values.append(filtered_data.get(col))
+        if batch:
+            self._copy_batch(batch)
+        return True
+
+    def insert_vehicles_many(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert a batch of vehicle records right away with execute_values (bypassing the insert buffer).
+        Existing (vehicle_id, data_source) keys are skipped. Returns the number of rows inserted.
+        """
+        valid_rows = [self._prepare_row(row) for row in rows if row.get('vehicle_id') and row.get('data_source')]
+        if len(valid_rows) != len(rows):
+            self.log.error(f"ERROR: Skipped {len(rows) - len(valid_rows)} rows without 'vehicle_id'/'data_source'")
+        if not valid_rows:
+            return 0
+        return self._write_batch(valid_rows)
+
+    def _prepare_row(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only table columns and pack the BOOL_COLUMNS flags into the features bitmap (missing -> 0)."""
+        # O(1) lookups against the precomputed set
+        row = {k: v for k, v in data.items() if k in self.VALID_COLUMNS}
+        row['vehicle_id'] = str(data['vehicle_id'])
+        if 'features' not in row:
+            row['features'] = ''.join('1' if data.get(col) else '0' for col in self.BOOL_COLUMNS)
+        return row
+
+    def flush(self) -> int:
+        """
+        Write all buffered rows and pending updated_at refreshes to the database.
+        Returns the number of rows inserted.
+        """
+        with self._buffer_lock:
+            batch, self._insert_buffer = self._insert_buffer, []
+            touches, self._touch_buffer = self._touch_buffer, {}
+            self._touch_count = 0
+        if touches:
+            self._write_touches(touches)
+        if not batch:
+            return 0
+        return self._copy_batch(batch)
 
-            query = sql.SQL("INSERT INTO {}.{} ({}) VALUES ({})").format(
+    def _insert_query(self, conn, columns: frozenset) -> tuple:
+        """Return (ordered columns, INSERT text) for a column set, composing the SQL only on first use."""
+        cached = self._query_cache.get(columns)
+        if cached is None:
+            ordered = tuple(col for col in self.COPY_COLUMNS if col in columns) + \
+                      tuple(sorted(columns.difference(self.COPY_COLUMNS)))
+            query = sql.SQL(
+                "INSERT INTO {}.{} ({}) VALUES %s "
+                "ON CONFLICT (vehicle_id, data_source) DO NOTHING RETURNING vehicle_id"
+            ).format(
                 sql.Identifier(self.schema_name),
                 sql.Identifier(self.table_name),
-                sql.SQL(', ').join(map(sql.Identifier, columns)),
-                sql.SQL(', ').join(placeholders)
-            )
+                sql.SQL(', ').join(self.COL_IDENT[col] for col in ordered)
+            ).as_string(conn)
+            cached = self._query_cache[columns] = (ordered, query)
+        return cached
 
-            cursor.execute(query, values)
+    def _sync_enum_labels(self, conn, rows: List[Dict[str, Any]]):
+        """
+        Make sure every ENUM column value in rows is a label of its type.
+        Values are normalised to str; unseen labels are added with ALTER TYPE ... ADD VALUE (autocommitted,
+        since new labels can't be used in the transaction that adds them). Values too long to be a label
+        are stored as NULL.
+        """
+        cursor = conn.cursor()
+        autocommit = conn.autocommit
+        try:
+            conn.autocommit = True
+            with self._enum_lock:
+                if self._enum_labels is None:
+                    cursor.execute(
+                        "SELECT t.typname, e.enumlabel FROM pg_enum e "
+                        "JOIN pg_type t ON t.oid = e.enumtypid "
+                        "JOIN pg_namespace n ON n.oid = t.typnamespace WHERE n.nspname = %s",
+                        (self.schema_name,)
+                    )
+                    self._enum_labels = {col: set() for col in self.ENUM_COLUMNS}
+                    for type_name, label in cursor.fetchall():
+                        col = type_name[:-len('_enum')]
+                        if col in self._enum_labels:
+                            self._enum_labels[col].add(label)
+
+                for col in self.ENUM_COLUMNS:
+                    labels = self._enum_labels[col]
+                    for row in rows:
+                        value = row.get(col)
+                        if value is None:
+                            continue
+                        value = str(value)
+                        if len(value.encode('utf-8')) > self.ENUM_LABEL_MAX_BYTES:
+                            self.log.warning(f"Value too long for {col}_enum, storing NULL: {value[:80]}")
+                            row[col] = None
+                            continue
+                        row[col] = value
+                        if value not in labels:
+                            cursor.execute(sql.SQL("ALTER TYPE {}.{} ADD VALUE IF NOT EXISTS %s").format(
+                                sql.Identifier(self.schema_name),
+                                sql.Identifier(f"{col}_enum")
+                            ), (value,))
+                            labels.add(value)
+        finally:
+            conn.autocommit = autocommit
+            cursor.close()
+
+    def _insert_values(self, ordered: tuple, rows: List[Dict[str, Any]]) -> List[list]:
+        """Value lists for execute_values in column order; native lists/dicts in JSONB columns are bound as JSON."""
+        values = [[row[col] for col in ordered] for row in rows]
+        for index in [i for i, col in enumerate(ordered) if col in self.JSON_COLUMNS]:
+            for value in values:
+                if isinstance(value[index], (list, dict)):
+                    value[index] = extras.Json(value[index], dumps=_json_dumps)
+        return values
+
+    def _write_batch(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert rows with execute_values (one statement per page).
+        Existing (vehicle_id, data_source) keys are skipped atomically by ON CONFLICT DO NOTHING, so no pre-insert
+        existence check is needed. If the batch fails, it is retried row by row so one bad row doesn't lose the
+        rest. Returns the number of rows that were actually new.
+        """
+        conn = None
+        cursor = None
+        started = time.perf_counter()
+        try:
+            # execute_values needs one column list per statement, so group rows by their column set
+            groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+            for row in rows:
+                groups.setdefault(frozenset(row), []).append(row)
+
+            conn = self._get_connection()
+            self._sync_enum_labels(conn, rows)
+            cursor = conn.cursor()
+
+            inserted = 0
+            for columns, group in groups.items():
+                ordered, query = self._insert_query(conn, columns)
+                values = self._insert_values(ordered, group)
+                # RETURNING yields only the rows that were new; conflicts are skipped server-side
+                inserted += len(extras.execute_values(cursor, query, values, page_size=self.BATCH_SIZE, fetch=True))
             conn.commit()
 
-            self.log.info(f"SUCCESS: Vehicle '{unique_id}' inserted successfully")
-            return True
+            elapsed = time.perf_counter() - started
+            self.log.info(f"SUCCESS: Inserted {inserted}/{len(rows)} buffered vehicles "
+                          f"in {elapsed:.2f}s ({len(rows) / max(elapsed, 1e-6):.0f} rows/sec)")
+            return inserted
 
-        except psycopg2.IntegrityError as e:
-            self.log.error(f"ERROR: Integrity error during insertion: {e}")
+        except Exception as e:
+            self.log.error(f"ERROR: Failed to insert {len(rows)} buffered vehicles: {e}")
+            # A dead connection can't be rolled back; _put_connection drops it from the pool
+            if conn and not conn.closed:
+                conn.rollback()
+                if len(rows) > 1:
+                    return self._write_rows_individually(conn, rows)
+            return 0
+        finally:
+            if cursor:
+                cursor.close()
             if conn:
+                self._put_connection(conn)
+
+    def _write_rows_individually(self, conn, rows: List[Dict[str, Any]]) -> int:
+        """
+        Fallback for a failed batch: insert rows one at a time, each under its own SAVEPOINT, so a bad row
+        (NULL listing_url, failed CHECK, unadaptable value) only loses itself. The accepted rows are committed
+        together and the rejected vehicle_ids are logged. Returns the number of rows that were actually new.
+        """
+        self.log.info(f"Retrying {len(rows)} vehicles row by row")
+        cursor = conn.cursor()
+        inserted = 0
+        rejected = []
+        try:
+            for row in rows:
+                ordered, query = self._insert_query(conn, frozenset(row))
+                cursor.execute("SAVEPOINT insert_row")
+                try:
+                    inserted += len(extras.execute_values(cursor, query, self._insert_values(ordered, [row]),
+                                                          fetch=True))
+                    cursor.execute("RELEASE SAVEPOINT insert_row")
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO SAVEPOINT insert_row")
+                    rejected.append(row['vehicle_id'])
+                    self.log.debug(f"Rejected vehicle {row['vehicle_id']} ({row.get('data_source')}): {e}")
+            conn.commit()
+        except Exception as e:
+            self.log.error(f"ERROR: Row-by-row insert of {len(rows)} vehicles failed: {e}")
+            conn.rollback()
+            return 0
+        finally:
+            cursor.close()
+
+        if rejected:
+            self.log.error(f"ERROR: Rejected {len(rejected)}/{len(rows)} vehicles: {', '.join(rejected)}")
+        self.log.info(f"SUCCESS: Inserted {inserted}/{len(rows)} vehicles row by row")
+        return inserted
+
+    def _rows_to_copy(self, rows: List[Dict[str, Any]]) -> io.BytesIO:
+        """Serialize rows into an in-memory COPY BINARY stream ordered by COPY_COLUMNS."""
+        data = bytearray(COPY_BINARY_HEADER)
+        serialize = self._serialize_copy_row
+        for row in rows:
+            serialize(row, data)
+        data += COPY_BINARY_TRAILER
+        return io.BytesIO(data)
+
+    def insert_vehicles_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Bulk-insert vehicle records with COPY FROM STDIN.
+        Rows are grouped by data_source and each group is copied straight into its partition; several
+        groups are loaded in parallel, each on its own pooled connection.
+        Returns the number of rows inserted.
+        """
+        valid_rows = [self._prepare_row(row) for row in rows if row.get('vehicle_id') and row.get('data_source')]
+        if len(valid_rows) != len(rows):
+            self.log.error(f"ERROR: Skipped {len(rows) - len(valid_rows)} rows without 'vehicle_id'/'data_source'")
+        if not valid_rows:
+            return 0
+        return self._copy_batch(valid_rows)
+
+    def _copy_batch(self, rows: List[Dict[str, Any]]) -> int:
+        """COPY prepared rows into their partitions in parallel. Returns the number of rows inserted."""
+        # COPY only carries COPY_COLUMNS; rows setting other columns (e.g. is_vehicle_available) use execute_values
+        other_rows = [row for row in rows if not row.keys() <= self.COPY_SET]
+        inserted = self._write_batch(other_rows) if other_rows else 0
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            if row.keys() <= self.COPY_SET:
+                groups.setdefault(self._partition_name(row['data_source']), []).append(row)
+        if not groups:
+            return inserted
+
+        copied_rows = len(rows) - len(other_rows)
+        started = time.perf_counter()
+        if len(groups) == 1:
+            copied = self._copy_rows(*groups.popitem())
+        else:
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                copied = sum(executor.map(self._copy_rows, groups.keys(), groups.values()))
+
+        elapsed = time.perf_counter() - started
+        self.log.info(f"SUCCESS: Bulk-inserted {copied}/{copied_rows} vehicles via COPY "
+                      f"in {elapsed:.2f}s ({copied_rows / max(elapsed, 1e-6):.0f} rows/sec)")
+        return inserted + copied
+
+    def _copy_rows(self, target_table: str, rows: List[Dict[str, Any]]) -> int:
+        """
+        COPY prepared rows into target_table in one stream.
+        If the batch collides with existing (vehicle_id, data_source) keys, it is re-loaded through a temporary
+        staging table and merged with ON CONFLICT DO NOTHING so duplicates are skipped. If COPY fails for any
+        other reason, the rows are inserted with _write_batch, which isolates bad rows.
+        Returns the number of rows inserted.
+        """
+        conn = None
+        cursor = None
+        try:
+            conn = self._get_connection()
+            self._sync_enum_labels(conn, rows)
+            cursor = conn.cursor()
+
+            buffer = self._rows_to_copy(rows)
+            columns = sql.SQL(', ').join(self.COL_IDENT[col] for col in self.COPY_COLUMNS)
+            target = sql.Identifier(target_table)
+            staging_table = sql.Identifier(f"{target_table}_staging")
+
+            copy_query = sql.SQL("COPY {}.{} ({}) FROM STDIN WITH (FORMAT BINARY)").format(
+                sql.Identifier(self.schema_name),
+                target,
+                columns
+            )
+            try:
+                cursor.copy_expert(copy_query, buffer)
+                conn.commit()
+                inserted = len(rows)
+            except UniqueViolation:
+                # Some rows already exist: merge through a staging table instead. Other integrity errors
+                # (NOT NULL, CHECK) would fail the merge too, so they go straight to the row-wise fallback
                 conn.rollback()
-            return False
+                buffer.seek(0)
+                cursor.execute(sql.SQL(
+                    "CREATE TEMP TABLE {} (LIKE {}.{} INCLUDING DEFAULTS) ON COMMIT DROP"
+                ).format(staging_table, sql.Identifier(self.schema_name), target))
+                cursor.copy_expert(
+                    sql.SQL("COPY {} ({}) FROM STDIN WITH (FORMAT BINARY)").format(staging_table, columns),
+                    buffer
+                )
+                cursor.execute(sql.SQL(
+                    "INSERT INTO {}.{} ({}) SELECT {} FROM {} ON CONFLICT (vehicle_id, data_source) DO NOTHING"
+                ).format(sql.Identifier(self.schema_name), target, columns, columns, staging_table))
+                inserted = cursor.rowcount
+                conn.commit()
+
+            self.log.debug(f"Copied {inserted}/{len(rows)} vehicles into {target_table}")
+            return inserted
+
         except Exception as e:
-            self.log.error(f"ERROR: Failed to insert vehicle: {e}")
-            if conn:
+            self.log.error(f"ERROR: Failed to bulk-insert vehicles into {target_table}, "
+                           f"falling back to INSERT: {e}")
+            if conn and not conn.closed:
                 conn.rollback()
-            return False
+            return self._write_batch(rows)
         finally:
             if cursor:
                 cursor.close()
             if conn:
                 self._put_connection(conn)
 
-    def touch_updated_at(self, vehicle_id: str, data_source: str) -> bool:
+    def touch_updated_at(self, vehicle_id: str, data_source: str) -> None:
         """
-        Update only the updated_at DATE for a given record, based on vehicle_id + data_source.
-        Returns True if a row was updated, False if none matched.
+        Queue a refresh of the updated_at DATE for a given record, based on vehicle_id + data_source.
+        Refreshes are applied with one UPDATE per data_source once BATCH_SIZE are pending, or on flush()/close().
+        Returns nothing: whether a row matched is only known when the batch is written (see _write_touches).
         """
+        touches = None
+        with self._buffer_lock:
+            self._touch_buffer.setdefault(data_source, set()).add(str(vehicle_id))
+            self._touch_count += 1
+            if self._touch_count >= self.BATCH_SIZE:
+                touches, self._touch_buffer = self._touch_buffer, {}
+                self._touch_count = 0
+
+        if touches:
+            self._write_touches(touches)
+
+    def _write_touches(self, touches: Dict[str, set]) -> int:
+        """Set updated_at = CURRENT_DATE for the queued ids of each data_source. Returns the number of rows updated."""
         conn = None
         cursor = None
         try:
-            unique_id = self.generate_unique_id(vehicle_id, data_source)
             conn = self._get_connection()
             cursor = conn.cursor()
-            query = sql.SQL("UPDATE {}.{} SET updated_at = CURRENT_DATE WHERE unique_id = %s").format(
+            query = sql.SQL(
+                "UPDATE {}.{} SET updated_at = CURRENT_DATE WHERE data_source = %s AND vehicle_id = ANY(%s)"
+            ).format(
                 sql.Identifier(self.schema_name),
                 sql.Identifier(self.table_name)
             )
-            cursor.execute(query, (unique_id,))
+            updated = 0
+            requested = 0
+            for data_source, vehicle_ids in touches.items():
+                cursor.execute(query, (data_source, list(vehicle_ids)))
+                updated += cursor.rowcount
+                requested += len(vehicle_ids)
             conn.commit()
-            updated = cursor.rowcount > 0
-            if updated:
-                self.log.info(f"UPDATED: refreshed updated_at for '{unique_id}'")
-            else:
-                self.log.info(f"NO-OP: no row found for '{unique_id}'")
+            self.log.info(f"UPDATED: refreshed updated_at for {updated}/{requested} existing vehicles")
             return updated
         except Exception as e:
             self.log.error(f"ERROR: Failed to touch updated_at: {e}")
             if conn:
                 conn.rollback()
-            return False
+            return 0
         finally:
             if cursor:
                 cursor.close()
@@ -478,6 +1107,9 @@ class VehicleDatabase:
             self.log.error(f"ERROR: Invalid date format '{cutoff_date_dd_mm_yyyy}'. Expected 'dd-mm-yyyy'.")
             return 0
 
+        # Pending updated_at refreshes must land before rows are judged stale
+        self.flush()
+
         conn = None
         cursor = None
         try:
@@ -527,7 +1159,9 @@ class VehicleDatabase:
                 self._put_connection(conn)
 
     def close(self):
-        """Close all connections in the pool."""
+        """Flush buffered rows and close all connections in the pool."""
+        self.flush()
+        self._release_connections()
         try:
             if hasattr(self, 'connection_pool') and self.connection_pool:
                 self.connection_pool.closeall()
@@ -538,6 +1172,15 @@ class VehicleDatabase:
 
 def ensure_database_exists(dbname=Config.DATABASE_NAME, user=Config.DATABASE_USER, password=Config.DATABASE_PASSWORD,
                            host=Config.DATABASE_HOST, port=Config.DATABASE_PORT):
+    marker = _startup_marker(f"{host}_{port}_{dbname}")
+    if _startup_marker_fresh(marker):
+        # The marker only saves the pg_database lookup if the database is still there (it may have been dropped)
+        try:
+            psycopg2.connect(dbname=dbname, user=user, password=password, host=host, port=port).close()
+            return
+        except psycopg2.OperationalError:
+            pass
+
     # Connect to default 'postgres' DB to create new one if missing
     conn = psycopg2.connect(dbname='postgres', user=user, password=password, host=host, port=port)
     conn.autocommit = True
@@ -552,6 +1195,7 @@ def ensure_database_exists(dbname=Config.DATABASE_NAME, user=Config.DATABASE_USE
 
     cur.close()
     conn.close()
+    _touch_startup_marker(marker)
 
 
 
@@ -0,0 +1,145 @@
+"""
+One-off migration of a vehicle table created with the old layout (unique_id primary key, one BOOLEAN column per
+feature, JSON images, no partitions) to the current one.
+
+    python -m database.migrate_legacy
+
+The old table is renamed to <table>_legacy (its indexes get a _legacy suffix), the current table is created as on a
+normal start, and every row is copied over with the BOOLEAN columns packed into the features bitmap.
+<table>_legacy is left in place; drop it once the copy has been checked.
+"""
+import psycopg2
+from psycopg2 import sql
+from configuration.config import Config
+from database.db import VehicleDatabase, ensure_database_exists, _relkind
+from logger.logger_setup import LoggerSetup
+
+
+def rename_legacy_table(log, schema_name: str, table_name: str) -> str | None:
+    """Rename the old-layout table and its indexes out of the way. Returns the new name, or None if not needed."""
+    legacy_name = f"{table_name}_legacy"
+    conn = psycopg2.connect(dbname=Config.DATABASE_NAME, user=Config.DATABASE_USER,
+                            password=Config.DATABASE_PASSWORD, host=Config.DATABASE_HOST, port=Config.DATABASE_PORT)
+    try:
+        with conn.cursor() as cursor:
+            if _relkind(cursor, schema_name, legacy_name) is not None:
+                log.info(f"'{schema_name}.{legacy_name}' already exists, continuing with the copy")
+                return legacy_name
+            relkind = _relkind(cursor, schema_name, table_name)
+            if relkind is None or relkind == 'p':
+                log.info(f"'{schema_name}.{table_name}' is missing or already migrated, nothing to do")
+                return None
+
+            cursor.execute(sql.SQL("ALTER TABLE {}.{} RENAME TO {}").format(
+                sql.Identifier(schema_name), sql.Identifier(table_name), sql.Identifier(legacy_name)
+            ))
+            # Index names share the schema namespace with the indexes of the new table (including <table>_pkey)
+            cursor.execute("SELECT indexname FROM pg_indexes WHERE schemaname = %s AND tablename = %s",
+                           (schema_name, legacy_name))
+            for (index_name,) in cursor.fetchall():
+                cursor.execute(sql.SQL("ALTER INDEX {}.{} RENAME TO {}").format(
+                    sql.Identifier(schema_name), sql.Identifier(index_name), sql.Identifier(f"{index_name}_legacy")
+                ))
+        conn.commit()
+        log.info(f"Renamed '{schema_name}.{table_name}' to '{schema_name}.{legacy_name}'")
+        return legacy_name
+    finally:
+        conn.close()
+
+
+def copy_legacy_rows(db: VehicleDatabase, legacy_name: str) -> int:
+    """INSERT ... SELECT every legacy row into the current table. Returns the number of rows copied."""
+    conn = db._get_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_schema = %s AND table_name = %s",
+            (db.schema_name, legacy_name)
+        )
+        legacy_columns = {row[0] for row in cursor.fetchall()}
+        source = sql.SQL("{}.{}").format(sql.Identifier(db.schema_name), sql.Identifier(legacy_name))
+
+        # Every value of an ENUM column must be a label of its type before the cast below
+        enum_rows = []
+        for col in db.ENUM_COLUMNS:
+            if col in legacy_columns:
+                cursor.execute(sql.SQL("SELECT DISTINCT {} FROM {} WHERE {} IS NOT NULL").format(
+                    sql.Identifier(col), source, sql.Identifier(col)
+                ))
+                enum_rows.extend({col: value} for (value,) in cursor.fetchall())
+        # _sync_enum_labels switches to autocommit, which needs the read transaction closed
+        conn.commit()
+        db._sync_enum_labels(conn, enum_rows)
+
+        columns = [col for col in (*db.STRING_COLUMNS, 'created_at', 'scraped_at', 'updated_at',
+                                   'is_vehicle_available') if col in legacy_columns]
+        expressions = []
+        for col in columns:
+            ident = sql.Identifier(col)
+            if col in db.JSON_COLUMNS:
+                expressions.append(sql.SQL("{}::jsonb").format(ident))
+            elif col in db.ENUM_COLUMNS:
+                # Values too long to be a label are stored as NULL, as on insert
+                expressions.append(sql.SQL("CASE WHEN octet_length({}) <= {} THEN {}::{}.{} END").format(
+                    ident, sql.Literal(db.ENUM_LABEL_MAX_BYTES), ident,
+                    sql.Identifier(db.schema_name), sql.Identifier(f"{col}_enum")
+                ))
+            else:
+                expressions.append(ident)
+
+        # Bit i of features = BOOL_COLUMNS[i]; NULL or missing columns become 0
+        features = sql.SQL(" || ").join(
+            sql.SQL("CASE WHEN {} THEN '1' ELSE '0' END").format(sql.Identifier(col)) if col in legacy_columns
+            else sql.SQL("'0'")
+            for col in db.BOOL_COLUMNS
+        )
+
+        cursor.execute(sql.SQL(
+            "INSERT INTO {}.{} ({}, features) SELECT {}, ({})::bit varying FROM {} "
+            "ON CONFLICT (vehicle_id, data_source) DO NOTHING"
+        ).format(
+            sql.Identifier(db.schema_name),
+            sql.Identifier(db.table_name),
+            sql.SQL(', ').join(map(sql.Identifier, columns)),
+            sql.SQL(', ').join(expressions),
+            features,
+            source
+        ))
+        copied = cursor.rowcount
+        conn.commit()
+        return copied
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        db._put_connection(conn)
+
+
+def main(schema_name: str = "vehicle_marketplace", table_name: str = "vehicle_data"):
+    log = LoggerSetup("migration.log").get_logger()
+    ensure_database_exists()
+
+    legacy_name = rename_legacy_table(log, schema_name, table_name)
+    if legacy_name is None:
+        return
+
+    db = VehicleDatabase(logger=log, schema_name=schema_name, table_name=table_name)
+    try:
+        # The startup marker may skip the DDL; the new table has to exist before the copy
+        conn = db._get_connection()
+        with conn.cursor() as cursor:
+            relkind = _relkind(cursor, schema_name, table_name)
+        db._put_connection(conn)
+        if relkind != 'p':
+            db._initialize_database()
+
+        copied = copy_legacy_rows(db, legacy_name)
+        log.info(f"Copied {copied} rows from '{schema_name}.{legacy_name}' into '{schema_name}.{table_name}'. "
+                 f"Drop '{schema_name}.{legacy_name}' once the data has been checked.")
+    finally:
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,36 @@
-from scrapper import autoscout24_complete, autoscout24_recent, mobile_de_complete, mobile_de_recent
 from database.db import ensure_database_exists
+from multiprocessing import Process
+import importlib
 import sys
 
+# Launcher name -> "module:function"; only the chosen scraper module is imported
+DISPATCH = {
+    'autoscout24_complete': 'scrapper.autoscout24_complete:main',
+    'mobile_complete': 'scrapper.mobile_de_complete:main',
+    'autoscout24_recent': 'scrapper.autoscout24_recent:main',
+    'mobile_recent': 'scrapper.mobile_de_recent:main',
+}
+
+
+def launch(name):
+    module_name, function_name = DISPATCH[name].split(':')
+    getattr(importlib.import_module(module_name), function_name)()
+
+
 if __name__ == '__main__':
     arguments = sys.argv[1:]
-    ensure_database_exists()
     # arguments = ['mobile_recent']
-    if arguments[0] == 'autoscout24_complete':
-        autoscout24_complete.main()
-    elif arguments[0] == 'mobile_complete':
-        mobile_de_complete.main()
-    elif arguments[0] == 'autoscout24_recent':
-        autoscout24_recent.main()
-    elif arguments[0] == 'mobile_recent':
-        mobile_de_recent.main()
+    if not arguments or any(name not in DISPATCH for name in arguments):
+        print('Available launcher names are: \n' + '\n'.join(f'- {name}' for name in DISPATCH))
+        sys.exit(1)
+
+    ensure_database_exists()
+    if len(arguments) == 1:
+        launch(arguments[0])
     else:
-        print('Available launcher names are: \n- autoscout24_complete\n- mobile_complete\n- autoscout24_recent\n- mobile_recent')
+        # Several sources at once: one process each; the complete scrapers COPY into their own partitions
+        processes = [Process(target=launch, args=(name,), name=name) for name in arguments]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
@@ -1,25 +1,60 @@
+import re
 import time
 from typing import List, Dict, Any, Optional
-import json
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser
 from dataclasses import dataclass
 from datetime import datetime
-from utils.key_mapping import convert_vehicle_data
-from utils.filters import *
+import itertools
 import threading
+from utils.key_mapping import convert_vehicle_data
 from proxies.webshare import WEBSHARE
 from database.db import VehicleDatabase
 from logger.logger_setup import LoggerSetup
 from configuration.config import Config
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import brotli  # noqa: F401 -- urllib3 only decodes br responses when it is installed
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# Raw bytes of the Next.js state blob embedded in every detail page
+_NEXT_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# Values parse_listing treats as missing; empty lists/dicts are checked separately since they are unhashable
+_EMPTY_VALUES = frozenset((None, ""))
+_PLACEHOLDER_VALUES = frozenset((None, "", "N/A", "unknown"))
+
+
+def _nonempty(value: Any, empty: frozenset = _EMPTY_VALUES) -> bool:
+    """True unless value is in empty or is an empty list/dict (0 and False count as values)"""
+    if value.__class__ in (list, dict):
+        return bool(value)
+    return value not in empty
+
+
+def deep_get(data: Any, *keys: str, default: Any = None) -> Any:
+    """Follow keys through nested dicts, returning default as soon as a level is missing or not a dict"""
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
 @dataclass
 class ScraperConfig:
     """Configuration for the hourly scraper"""
     max_pages: int = 200
     max_retries: int = 3
-    delay_between_requests: float = 1.0
+    max_throttle: float = 10.0
+    proxy_rotate_every: int = 50
 
 
 @dataclass
@@ -37,53 +72,124 @@ class ScraperStats:
 class AutoScout24HourlyScraper:
     """Hourly scraper for AutoScout24 - fetches latest listings sorted by age"""
 
+    SEARCH_URL = "https://www.autoscout24.de/_next/data/as24-search-funnel_main-20250924171425/lst.json"
+
+    # German vehicleDetails labels -> output keys
+    _VEHICLE_DETAIL_KEYS = {
+        "Kilometerstand": "vehicle_detail_mileage",
+        "Getriebe": "vehicle_detail_transmission",
+        "Erstzulassung": "vehicle_detail_first_registration",
+        "Kraftstoff": "vehicle_detail_fuel",
+        "Leistung": "vehicle_detail_power",
+        "Kraftstoffverbrauch": "vehicle_detail_fuel_consumption",
+        "CO₂-Emissionen": "vehicle_detail_co2_emission",
+    }
+
     def __init__(self, config: Optional[ScraperConfig] = None):
         """Initialize scraper with configuration"""
         self.config = config or ScraperConfig()
         self.stats = ScraperStats()
         self.log = LoggerSetup("autoscout24_recent.log").get_logger()
         self.webshare_obj = WEBSHARE()
-        self.unique_features = autoscout24_features
         self.db_obj = VehicleDatabase(logger=self.log)
         self.thread_limit = Config.AUTOSCOUT_THREAD_COUNT
+        # One pooled session so TCP/TLS connections are reused across requests (retries are handled below)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=max(64, self.thread_limit), max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Detail-page workers live for the whole run (created in run())
+        self.executor: Optional[ThreadPoolExecutor] = None
+        # Single worker that fetches the next search page while the current one is processed
+        self.page_executor: Optional[ThreadPoolExecutor] = None
+        # Request headers, built once
+        self._pagination_headers = {
+            "accept": "*/*",
+            "accept-encoding": _ACCEPT_ENCODING,
+            "accept-language": "en-PK,en;q=0.9,ur-PK;q=0.8,ur;q=0.7,en-GB;q=0.6,en-US;q=0.5",
+            "priority": "u=1, i",
+            "referer": self.SEARCH_URL,
+            "sec-ch-ua": '"Chromium";v="140", "Not=A?Brand";v="24", "Google Chrome";v="140"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"Windows"',
+            "sec-fetch-dest": "empty",
+            "sec-fetch-mode": "cors",
+            "sec-fetch-site": "same-origin",
+            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "x-nextjs-data": "1"
+        }
+        self._detail_headers = {
+            "Upgrade-Insecure-Requests": "1",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "sec-ch-ua": '"Chromium";v="140", "Not=A?Brand";v="24", "Google Chrome";v="140"',
+            "sec-ch-ua-mobile": "?0",
+            "sec-ch-ua-platform": '"Windows"'
+        }
+        # Adaptive delay before each request: grows on 429/503, decays on success
+        self._throttle = 0.0
+        # Current proxy, replaced after a failed attempt or every proxy_rotate_every successful requests
+        self._proxy = self.webshare_obj.get_proxy()
+        self._proxy_requests = 0
+        self._proxy_lock = threading.Lock()
+        # Request counters bumped from the worker threads; next() on itertools.count is atomic under the GIL
+        self._request_counter = itertools.count()
+        self._failed_request_counter = itertools.count()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _shutdown_executors(self):
+        """Stop the run-scoped worker pools; a prefetched page that is not needed anymore is cancelled"""
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        if self.page_executor:
+            self.page_executor.shutdown(wait=False, cancel_futures=True)
+            self.page_executor = None
+
+    def close(self):
+        """Release worker threads, HTTP connections and database connections"""
+        self._shutdown_executors()
+        self.session.close()
+        self.db_obj.close()
+
+    def _rotate_proxy(self):
+        with self._proxy_lock:
+            self._proxy = self.webshare_obj.get_proxy()
+            self._proxy_requests = 0
+
+    def _count_proxy_use(self):
+        with self._proxy_lock:
+            self._proxy_requests += 1
+            if self._proxy_requests >= self.config.proxy_rotate_every:
+                self._proxy = self.webshare_obj.get_proxy()
+                self._proxy_requests = 0
 
     def _make_request(self, url: str, params: Optional[Dict[str, Any]] = None,
                       is_pagination: bool = False) -> Optional[requests.Response]:
         """Make HTTP request with retry logic and error handling"""
+        headers = self._pagination_headers if is_pagination else self._detail_headers
         for attempt in range(self.config.max_retries):
             try:
-                if is_pagination:
-                    headers = {
-                        "accept": "*/*",
-                        "accept-language": "en-PK,en;q=0.9,ur-PK;q=0.8,ur;q=0.7,en-GB;q=0.6,en-US;q=0.5",
-                        "priority": "u=1, i",
-                        "referer": url,
-                        "sec-ch-ua": '"Chromium";v="140", "Not=A?Brand";v="24", "Google Chrome";v="140"',
-                        "sec-ch-ua-mobile": "?0",
-                        "sec-ch-ua-platform": '"Windows"',
-                        "sec-fetch-dest": "empty",
-                        "sec-fetch-mode": "cors",
-                        "sec-fetch-site": "same-origin",
-                        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                        "x-nextjs-data": "1"
-                    }
-                else:
-                    headers = {
-                        "Upgrade-Insecure-Requests": "1",
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                        "sec-ch-ua": '"Chromium";v="140", "Not=A?Brand";v="24", "Google Chrome";v="140"',
-                        "sec-ch-ua-mobile": "?0",
-                        "sec-ch-ua-platform": '"Windows"'
-                    }
-
-                response = requests.get(url, params=params, headers=headers,
-                                        proxies=self.webshare_obj.get_proxy(), timeout=30)
-                self.stats.total_requests += 1
+                if self._throttle > 0:
+                    time.sleep(self._throttle)
+
+                response = self.session.get(url, params=params, headers=headers,
+                                            proxies=self._proxy, timeout=30)
+                next(self._request_counter)
 
                 if response.status_code == 200:
+                    self._throttle = self._throttle * 0.5 if self._throttle > 0.05 else 0.0
+                    self._count_proxy_use()
                     return response
-                else:
-                    self.log.info(f"⚠️  HTTP {response.status_code} on attempt {attempt + 1}/{self.config.max_retries}")
+                if response.status_code in (429, 503):
+                    self._throttle = min(self._throttle * 2 or 0.5, self.config.max_throttle)
+                    self.log.info(f"⚠️  HTTP {response.status_code}, throttling requests by {self._throttle:.2f}s")
+                self.log.info(f"⚠️  HTTP {response.status_code} on attempt {attempt + 1}/{self.config.max_retries}")
 
             except requests.exceptions.Timeout:
                 self.log.error(f"⏱️  Timeout on attempt {attempt + 1}/{self.config.max_retries}")
@@ -92,50 +198,63 @@ class AutoScout24HourlyScraper:
             except Exception as e:
                 self.log.error(f"❌ Error on attempt {attempt + 1}/{self.config.max_retries}: {str(e)[:100]}")
 
+            self._rotate_proxy()
             if attempt < self.config.max_retries - 1:
                 time.sleep(2 ** attempt)  # Exponential backoff
 
-        self.stats.failed_requests += 1
+        next(self._failed_request_counter)
         return None
 
+    @staticmethod
+    def _page_params(page_number: int) -> Dict[str, Any]:
+        """Search parameters for one page of the newest listings"""
+        return {
+            "atype": "C",
+            "cy": "D",
+            "damaged_listing": "exclude",
+            "desc": "1",
+            "ocs_listing": "include",
+            "powertype": "kw",
+            "search_id": "fgm1i1ycu0",
+            "sort": "age",  # Sort by age (newest first)
+            "source": "listpage_pagination",
+            "ustate": "N,U",
+            "page": str(page_number)
+        }
+
     def get_pagination_response(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get search results with parameters"""
         response = self._make_request(url, params=params, is_pagination=True)
 
         if response:
             try:
-                return response.json()
-            except json.JSONDecodeError:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 self.log.error("❌ Failed to parse JSON response")
                 return None
         return None
 
     def get_detail_response(self, url: str) -> Optional[Dict[str, Any]]:
-        """Get product detail page and extract JSON (__NEXT_DATA__) using BeautifulSoup"""
+        """Get product detail page and extract JSON (__NEXT_DATA__) straight from the raw bytes"""
         response = self._make_request(url, is_pagination=False)
 
         if not response:
             return None
 
         try:
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Find the <script> tag with id="__NEXT_DATA__"
-            script_tag = soup.find("script", id="__NEXT_DATA__")
-            if not script_tag:
+            match = _NEXT_RE.search(response.content)
+            if not match:
                 self.log.info("⚠️ No <script id='__NEXT_DATA__'> found on page")
                 return None
 
-            # Get the script content
-            script_content = script_tag.string or script_tag.get_text()
-            if not script_content:
+            script_content = match.group(1)
+            if not script_content.strip():
                 self.log.info("⚠️ Script tag found but content is empty")
                 return None
 
-            # Parse JSON
-            return json.loads(script_content)
+            return orjson.loads(script_content)
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.log.error(f"❌ JSON decode error: {str(e)[:100]}")
             return None
         except Exception as e:
@@ -155,23 +274,16 @@ class AutoScout24HourlyScraper:
             if price:
                 parsed["price"] = price
 
-            # Images
-            images = data.get("images")
-            if isinstance(images, list) and images:
-                parsed["images"] = json.dumps(images, ensure_ascii=False)
-            else:
-                parsed["images"] = json.dumps([])
-
             # Vehicle details
             vehicle = data.get("vehicle", {})
             for key, value in vehicle.items():
-                if value not in [None, "", [], {}]:
+                if _nonempty(value):
                     parsed[f"vehicle_{key}"] = value
 
             # Location
             loc = data.get("location", {})
             for key, value in loc.items():
-                if value not in [None, "", [], {}]:
+                if _nonempty(value):
                     parsed[f"location_{key}"] = value
 
             # Seller
@@ -181,37 +293,30 @@ class AutoScout24HourlyScraper:
             # Tracking
             tracking = data.get("tracking", {})
             for key, value in tracking.items():
-                if value not in [None, "", [], {}]:
+                if _nonempty(value):
                     parsed[f"tracking_{key}"] = value
 
             # Tracking Parameters
             for param in data.get("trackingParameters", []):
                 key = param.get("key")
                 value = param.get("value")
-                if key and value not in [None, "", [], {}]:
+                if key and _nonempty(value):
                     parsed[f"tracking_{key}"] = value
 
             # Vehicle Details with translations
-            translations = {
-                "Kilometerstand": "mileage",
-                "Getriebe": "transmission",
-                "Erstzulassung": "first_registration",
-                "Kraftstoff": "fuel",
-                "Leistung": "power",
-                "Kraftstoffverbrauch": "fuel_consumption",
-                "CO₂-Emissionen": "co2_emission",
-            }
-
             for item in data.get("vehicleDetails", []):
                 label = item.get("ariaLabel")
                 value = item.get("data")
-                if label and value not in [None, "", [], {}]:
-                    label_en = translations.get(label, label)
-                    parsed[f"vehicle_detail_{label_en.replace(' ', '_').lower()}"] = value
+                if label and _nonempty(value):
+                    key = self._VEHICLE_DETAIL_KEYS.get(label) or f"vehicle_detail_{label.replace(' ', '_').lower()}"
+                    parsed[key] = value
 
             # Clean up
-            parsed = {k: v for k, v in parsed.items()
-                      if v not in [None, "", [], {}, "N/A", "unknown"]}
+            parsed = {k: v for k, v in parsed.items() if _nonempty(v, _PLACEHOLDER_VALUES)}
+
+            # Images stay a native list (an empty one is kept); the database layer serializes them to JSONB
+            images = data.get("images")
+            parsed["images"] = images if isinstance(images, list) else []
 
             return parsed
         except Exception as e:
@@ -220,14 +325,6 @@ class AutoScout24HourlyScraper:
 
     def parse_detail_listing(self, basic_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse detailed listing data from product page"""
-        listing_id = basic_data.get('id')
-
-        # Check for duplicate
-        if self.db_obj.check_id_exists(listing_id, 'autoscout24'):
-            self.log.info(f"⏭️  Skipping duplicate ID: {listing_id}")
-            self.stats.duplicates_skipped += 1
-            return None
-
         try:
             # Construct full URL
             url = 'https://www.autoscout24.de' + basic_data.get('url', '')
@@ -239,72 +336,40 @@ class AutoScout24HourlyScraper:
                 self.log.info(f"⚠️  Failed to get details for: {url}")
                 return basic_data
 
+            ld = deep_get(product_response, 'props', 'pageProps', 'listingDetails', default={})
+            vehicle = deep_get(ld, 'vehicle', default={})
+
             # Extract description
-            try:
-                description = product_response['props']['pageProps']['listingDetails']['description']
-                if description:
-                    soup = BeautifulSoup(description, "html.parser")
-                    clean_text = soup.get_text().strip()
-                    basic_data['description'] = clean_text
-                else:
-                    basic_data['description'] = ''
-            except:
-                basic_data['description'] = ''
+            description = ld.get('description')
+            basic_data['description'] = HTMLParser(description).text(separator="\n").strip() if description else ''
 
-            try:
-                features = [p['id']['formatted'] for p in
-                            product_response['props']['pageProps']['listingDetails']['vehicle']['rawData']['equipment'][
-                                'as24']]
-            except:
-                features = []
-            self.unique_features.update(features)
+            equipment = deep_get(vehicle, 'rawData', 'equipment', 'as24', default=[])
+            features = [name for name in (deep_get(item, 'id', 'formatted') for item in equipment) if name]
 
-            new_data = {}
-            for feature in self.unique_features:
-                new_data[feature] = feature in features
+            # Equipment flags: only the listed items are set, the rest default to False in the DB
+            new_data = dict.fromkeys(features, True)
 
-            try:
-                for key, value in product_response['props']['pageProps']['listingDetails']['vehicle'].items():
-                    if isinstance(value, (type(None), str, int, float, bool)):
-                        new_data[key] = value
-            except:
-                pass
+            # Single pass over the vehicle block: plain values as-is, formatted objects by their display text
+            for key, value in vehicle.items():
+                if isinstance(value, (type(None), str, int, float, bool)):
+                    new_data[key] = value
+                elif isinstance(value, dict) and 'formatted' in value:
+                    new_data[key] = value['formatted']
 
-            try:
-                for key, value in product_response['props']['pageProps']['listingDetails']['vehicle'].items():
-                    if isinstance(value, dict) and 'formatted' in value:
-                        new_data[key] = value['formatted']
-            except:
-                pass
+            for key, value in (vehicle.get('wltp') or {}).items():
+                new_data[key] = value.get('formatted') if isinstance(value, dict) else None
 
-            try:
-                for key, value in product_response['props']['pageProps']['listingDetails']['vehicle']['wltp'].items():
-                    if value:
-                        new_data[key] = value['formatted']
-                    else:
-                        new_data[key] = None
-            except:
-                pass
+            for key, value in (vehicle.get('costModel') or {}).items():
+                if value:
+                    new_data[key] = value
 
-            try:
-                for key, value in product_response['props']['pageProps']['listingDetails']['vehicle'][
-                    'costModel'].items():
-                    if value:
-                        new_data[key] = value
-            except:
-                pass
+            price_text = deep_get(ld, 'prices', 'error', 'text')
+            if price_text is not None:
+                new_data['price_text'] = price_text
 
-            try:
-                new_data['price_text'] = product_response['props']['pageProps']['listingDetails']['prices']['error'][
-                    'text']
-            except:
-                pass
-
-            try:
-                new_data['identifier'] = product_response['props']['pageProps']['listingDetails']['identifier'][
-                    'offerReference']
-            except:
-                pass
+            identifier = deep_get(ld, 'identifier', 'offerReference')
+            if identifier is not None:
+                new_data['identifier'] = identifier
 
             basic_data.update(new_data)
             self.log.info(f"✅ Parsed: {basic_data.get('url', 'Unknown')[:50]} - €{basic_data.get('price', 'N/A')}")
@@ -315,41 +380,49 @@ class AutoScout24HourlyScraper:
             return basic_data
 
     def process_listings(self, listings: List[Dict[str, Any]]):
-        """Process multiple listings concurrently"""
-        lock = threading.Lock()
+        """Process multiple listings concurrently and insert the page's records in one batch"""
 
         def process_single(listing):
             try:
                 basic_data = self.parse_listing(listing)
                 if not basic_data:
-                    return
+                    return None
 
                 detailed_data = self.parse_detail_listing(basic_data)
                 if not detailed_data:
-                    return
+                    return None
 
                 # Build title
                 detailed_data[
                     'title'] = f"{detailed_data.get('vehicle_make', '')} {detailed_data.get('vehicle_model', '')} {detailed_data.get('vehicle_modelVersionInput', '')}".strip()
 
-                final_data = convert_vehicle_data(detailed_data, 'autoscout24')
-
-                # Thread-safe append and counter increment
-                with lock:
-                    self.db_obj.insert_vehicle(final_data)
-                    self.stats.total_listings += 1
-                    self.stats.list_process_per_page += 1
+                return convert_vehicle_data(detailed_data, 'autoscout24')
 
             except Exception as e:
                 self.log.error(f"❌ Error processing listing: {e}")
+                return None
 
-        with ThreadPoolExecutor(max_workers=self.thread_limit) as executor:
-            # Submit all tasks and collect futures
-            futures = [executor.submit(process_single, listing) for listing in listings]
-
-            # Collect results as they complete
-            for future in as_completed(futures):
-                future.result()
+        # One query for the whole page instead of a duplicate check per listing
+        existing = self.db_obj.existing_ids([listing.get('id') for listing in listings], 'autoscout24')
+        new_listings = [listing for listing in listings if str(listing.get('id')) not in existing]
+        skipped = len(listings) - len(new_listings)
+        if skipped:
+            self.log.info(f"⏭️  Skipping {skipped} duplicate IDs")
+            self.stats.duplicates_skipped += skipped
+        if not new_listings:
+            # Whole page already stored: no detail fetches; run() counts this as a page without new data
+            self.log.info("⏭️  All listings on this page are duplicates")
+            return
+        listings = new_listings
+
+        # Submit all tasks to the run-wide pool and wait for this page to finish
+        futures = [self.executor.submit(process_single, listing) for listing in listings]
+        page_rows = [row for row in (future.result() for future in as_completed(futures)) if row]
+
+        if page_rows:
+            inserted = self.db_obj.insert_vehicles_many(page_rows)
+            self.stats.total_listings += inserted
+            self.stats.list_process_per_page += inserted
 
     def run(self):
         """Main execution method - fetch latest listings sorted by age"""
@@ -360,30 +433,18 @@ class AutoScout24HourlyScraper:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.log.info(f"🕐 Run timestamp: {timestamp}")
 
-        url = "https://www.autoscout24.de/_next/data/as24-search-funnel_main-20250924171425/lst.json"
+        url = self.SEARCH_URL
         page_number = 1
+        self.executor = ThreadPoolExecutor(max_workers=self.thread_limit, thread_name_prefix="autoscout24-detail")
+        self.page_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autoscout24-page")
+        next_page = self.page_executor.submit(self.get_pagination_response, url, self._page_params(page_number))
 
         try:
             while page_number < self.config.max_pages:
                 self.log.info(f"\n{'=' * 60}")
                 self.log.info(f"📖 Processing page {page_number}")
 
-                # Build search parameters
-                params = {
-                    "atype": "C",
-                    "cy": "D",
-                    "damaged_listing": "exclude",
-                    "desc": "1",
-                    "ocs_listing": "include",
-                    "powertype": "kw",
-                    "search_id": "fgm1i1ycu0",
-                    "sort": "age",  # Sort by age (newest first)
-                    "source": "listpage_pagination",
-                    "ustate": "N,U",
-                    "page": str(page_number)
-                }
-
-                response = self.get_pagination_response(url, params)
+                response = next_page.result()
 
                 if not response or 'pageProps' not in response:
                     self.log.info(f"❌ Failed to get response for page {page_number}")
@@ -406,6 +467,11 @@ class AutoScout24HourlyScraper:
 
                 self.log.info(f"🔄 Processing {len(listings)} listings from this page")
 
+                # Fetch the next page while this page's detail requests run
+                if page_number < num_pages and page_number + 1 < self.config.max_pages:
+                    next_page = self.page_executor.submit(self.get_pagination_response, url,
+                                                          self._page_params(page_number + 1))
+
                 # Process listings
                 self.process_listings(listings)
                 self.stats.pages_processed += 1
@@ -427,16 +493,22 @@ class AutoScout24HourlyScraper:
 
                 page_number += 1
 
-                # Add delay between pages
-                time.sleep(self.config.delay_between_requests)
-
         except KeyboardInterrupt:
             self.log.error("\n\n⚠️  Scraping interrupted by user")
         except Exception as e:
             self.log.error(f"❌ Error during scraping: {str(e)[:200]}")
+        finally:
+            self._shutdown_executors()
 
+        self.db_obj.flush()
         elapsed_time = time.time() - start_time
 
+        # Workers are stopped, so the counters can be read (next() returns the number of prior calls)
+        self.stats.total_requests = next(self._request_counter)
+        self.stats.failed_requests = next(self._failed_request_counter)
+        self._request_counter = itertools.count()
+        self._failed_request_counter = itertools.count()
+
         # self.log. final statistics
         self.log.info(f"\n{'=' * 60}")
         self.log.info("📊 SCRAPING COMPLETED")
@@ -457,10 +529,9 @@ def main():
     # Create configuration
     config = ScraperConfig(
         max_pages=200,
-        max_retries=3,
-        delay_between_requests=1.0
+        max_retries=3
     )
 
     # Initialize and run scraper
-    scraper = AutoScout24HourlyScraper(config)
-    scraper.run()
+    with AutoScout24HourlyScraper(config) as scraper:
+        scraper.run()
@@ -5,6 +5,7 @@ from urllib.parse import urlencode, quote
 import requests
 from bs4 import BeautifulSoup
 from dataclasses import dataclass
+from contextlib import nullcontext
 import threading
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -26,6 +27,7 @@ class ScraperConfig:
     price_start: int = 0
     price_end: int = 90000
     initial_chunk_size: int = 100
+    bulk_load: bool = Config.BULK_LOAD
 
 
 @dataclass
@@ -454,19 +456,22 @@ class MobileDeScraper:
 
         self.log.info(f"📊 Generated {len(price_ranges)} initial price ranges")
 
-        for i, price_range in enumerate(price_ranges, 1):
-            try:
-                self.log.info(f"\n{'#' * 60}")
-                self.log.info(f"Range {i}/{len(price_ranges)}")
-                self.process_price_range(price_range)
-
-            except KeyboardInterrupt:
-                self.log.error("\n\n⚠️  Scraping interrupted by user")
-                break
-            except Exception as e:
-                self.log.error(f"❌ Error processing range {price_range}: {str(e)[:200]}")
-                continue
+        # Opt-in for standalone backfills: no index maintenance during the run, one rebuild at the end
+        with self.db_obj.bulk_load_context() if self.config.bulk_load else nullcontext():
+            for i, price_range in enumerate(price_ranges, 1):
+                try:
+                    self.log.info(f"\n{'#' * 60}")
+                    self.log.info(f"Range {i}/{len(price_ranges)}")
+                    self.process_price_range(price_range)
+
+                except KeyboardInterrupt:
+                    self.log.error("\n\n⚠️  Scraping interrupted by user")
+                    break
+                except Exception as e:
+                    self.log.error(f"❌ Error processing range {price_range}: {str(e)[:200]}")
+                    continue
 
+        self.db_obj.flush()
         elapsed_time = time.time() - start_time
         self.db_obj.mark_unavailable_before(start_date, 'mobile')
         # self.log. final statistics
@@ -1,19 +1,43 @@
 import time
+import random
 from typing import List, Dict, Any, Optional
-import json
+import orjson
+import ijson
 from urllib.parse import urlencode, quote
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.parser import HTMLParser
 from dataclasses import dataclass
-import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from utils.key_mapping import convert_vehicle_data
-from utils.filters import *
 from configuration.config import Config
 from database.db import VehicleDatabase
 from logger.logger_setup import LoggerSetup
 
+# The state blob is assigned right before __PUBLIC_CONFIG__ in the same inline script
+_INITIAL_STATE_MARKER = b'window.__INITIAL_STATE__ ='
+_PUBLIC_CONFIG_MARKER = b'window.__PUBLIC_CONFIG__'
+
+
+def _initial_state(html: bytes) -> Optional[bytes]:
+    """Raw JSON bytes of window.__INITIAL_STATE__, or None if the markers are not found"""
+    start = html.find(_INITIAL_STATE_MARKER)
+    end = html.find(_PUBLIC_CONFIG_MARKER, start) if start != -1 else -1
+    if end == -1:
+        return None
+    return html[start + len(_INITIAL_STATE_MARKER):end].strip().rstrip(b';')
+
+
+@lru_cache(maxsize=4096)
+def _html_to_text(html_desc: str) -> str:
+    """Plain text of a listing's HTML description; dealer boilerplate repeats verbatim, so results are memoized"""
+    if not html_desc:
+        return ''
+    body = HTMLParser(html_desc).body
+    return body.text(separator="\n").strip() if body else ''
+
 
 @dataclass
 class ScraperConfig:
@@ -21,8 +45,8 @@ class ScraperConfig:
     scrape_do_token: str = Config.SCRAPE_DO_TOKEN
     max_pages: int = 50
     max_retries: int = 5
-    delay_between_requests: float = .1
     min_response_size: int = 6000
+    max_retry_after: float = 30.0
 
 
 @dataclass
@@ -68,29 +92,61 @@ class MobileDeHourlyScraper:
         "envkv.co2Class": None,
         "envkv.consumption": None
     }
+    SEARCH_URL = "https://suchen.mobile.de/fahrzeuge/search.html"
+    # Query string shared by every search page, encoded once; only pageNumber is appended per page
+    SEARCH_QUERY = urlencode({
+        "dam": "false",
+        "isSearchRequest": "true",
+        "od": "down",
+        "ref": "srpNextPage",
+        "s": "Car",
+        "sb": "doc",  # Sort by date
+        "vc": "Car"
+    })
+
+    # FIELD_MAPPING split once: keys to rename and keys mapped to None (dropped)
+    _RENAME = {k: v for k, v in FIELD_MAPPING.items() if v is not None}
+    _DROP = frozenset(k for k, v in FIELD_MAPPING.items() if v is None)
 
     def __init__(self, config: Optional[ScraperConfig] = None):
         """Initialize scraper with configuration"""
         self.config = config or ScraperConfig()
         self.stats = ScraperStats()
         self.log = LoggerSetup("mobile_de_complete.log").get_logger()
-        self.unique_features = mobile_features
         self.db_obj = VehicleDatabase(logger=self.log)
         self.thread_limit = Config.MOBILE_THREAD_COUNT
+        # One keep-alive pool to scrape.do shared by the page loop and every worker thread
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=max(64, self.thread_limit), max_retries=0)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Detail-page workers live for the whole run (created in run())
+        self.executor: Optional[ThreadPoolExecutor] = None
+        # Single worker that fetches the next search page while the current one is processed
+        self.page_executor: Optional[ThreadPoolExecutor] = None
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """Seconds to wait before the next attempt: Retry-After if the response sent one, else jittered backoff"""
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.strip().isdigit():
+            return min(float(retry_after), self.config.max_retry_after)
+        return random.uniform(0.5, 1.0) * min(2 ** attempt, self.config.max_retry_after)
+
     def _make_request(self, url: str, use_proxy: bool = True) -> Optional[requests.Response]:
         """Make HTTP request with retry logic and error handling"""
+        # The target URL is encoded once; every retry reuses the same request URL
+        if use_proxy:
+            request_url = f"http://api.scrape.do/?url={quote(url, safe='')}&token={self.config.scrape_do_token}"
+        else:
+            request_url = url
         for attempt in range(self.config.max_retries):
+            response = None
             try:
-                if use_proxy:
-                    target_url = quote(url)
-                    proxy_url = f"http://api.scrape.do/?url={target_url}&token={self.config.scrape_do_token}"
-                    response = requests.get(proxy_url, timeout=30)
-                else:
-                    response = requests.get(url, timeout=30)
+                response = self.session.get(request_url, timeout=30)
 
                 self.stats.total_requests += 1
 
-                if response.status_code == 200 and len(response.text) > self.config.min_response_size:
+                if response.status_code == 200 and len(response.content) > self.config.min_response_size:
                     return response
                 elif response.status_code == 410:
                     self.log.info(f"⚠️  HTTP {response.status_code} Returning because Page is not available!")
@@ -105,21 +161,28 @@ class MobileDeHourlyScraper:
             except Exception as e:
                 self.log.info(f"❌ Error on attempt {attempt + 1}/{self.config.max_retries}: {str(e)[:100]}")
 
+            # Every failed attempt waits, so a struggling scrape.do isn't hit again by all workers at once
             if attempt < self.config.max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                time.sleep(self._retry_delay(attempt, response))
 
         self.stats.failed_requests += 1
         return None
 
-    def _extract_json_from_html(self, html_text: str) -> Optional[Dict[str, Any]]:
-        """Extract JSON data (window.__INITIAL_STATE__) from HTML response using BeautifulSoup"""
-        try:
-            soup = BeautifulSoup(html_text, "html.parser")
-            scripts = soup.find_all("script")
+    def _extract_json_from_html(self, html: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Extract JSON data (window.__INITIAL_STATE__) by slicing the raw HTML bytes between the two markers,
+        falling back to scanning the <script> tags with selectolax if the page layout differs
+        """
+        payload = _initial_state(html)
+        if payload is not None:
+            try:
+                return orjson.loads(payload)
+            except orjson.JSONDecodeError as e:
+                self.log.info(f"⚠️  Marker extraction failed, falling back to HTML parsing: {str(e)[:100]}")
 
-            for script in scripts:
-                # Get script content safely
-                script_content = script.string or script.get_text()
+        try:
+            for script in HTMLParser(html).css("script"):
+                script_content = script.text(deep=True)
                 if not script_content:
                     continue
 
@@ -140,9 +203,9 @@ class MobileDeHourlyScraper:
                     )
 
                     try:
-                        data = json.loads(json_str)
+                        data = orjson.loads(json_str)
                         return data
-                    except json.JSONDecodeError as e:
+                    except orjson.JSONDecodeError as e:
                         self.log.info(f"❌ JSON decode error: {str(e)[:100]}")
                         return None
 
@@ -153,23 +216,38 @@ class MobileDeHourlyScraper:
             self.log.info(f"❌ Error extracting JSON: {str(e)[:100]}")
             return None
 
-    def get_search_response(self, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Get search results with parameters"""
-        full_url = f"{url}?{urlencode(params)}"
+    def get_search_response(self, full_url: str) -> Optional[Dict[str, Any]]:
+        """Get the search.srp.data.searchResults object of a search page"""
         response = self._make_request(full_url)
+        if not response:
+            return None
 
-        if response:
-            return self._extract_json_from_html(response.text)
-        return None
+        # Stream only searchResults out of the state blob; the rest of the UI state is never built
+        payload = _initial_state(response.content)
+        if payload is not None:
+            try:
+                return next(ijson.items(payload, 'search.srp.data.searchResults', use_float=True), None)
+            except ijson.JSONError as e:
+                self.log.info(f"⚠️  Streaming search results failed, parsing the whole page: {str(e)[:100]}")
+
+        data = self._extract_json_from_html(response.content)
+        if not data:
+            return None
+        return data.get('search', {}).get('srp', {}).get('data', {}).get('searchResults')
 
     def get_detail_response(self, url: str) -> Optional[Dict[str, Any]]:
         """Get product detail page"""
         response = self._make_request(url)
 
         if response:
-            return self._extract_json_from_html(response.text)
+            return self._extract_json_from_html(response.content)
         return None
 
+    @classmethod
+    def _page_url(cls, page_number: int) -> str:
+        """Search URL for one page of the newest listings"""
+        return f"{cls.SEARCH_URL}?{cls.SEARCH_QUERY}&pageNumber={page_number}"
+
     def parse_basic_listing(self, listing: Dict[str, Any]) -> Dict[str, Any]:
         """Parse basic listing data from search results"""
         parsed = {
@@ -197,14 +275,13 @@ class MobileDeHourlyScraper:
 
         return parsed
 
-    def parse_detail_listing(self, basic_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Parse detailed listing data from product page"""
+    def parse_detail_listing(self, basic_data: Dict[str, Any], existing_ids: set) -> Optional[Dict[str, Any]]:
+        """Parse detailed listing data from product page; ids in existing_ids are already stored and skipped"""
         listing_id = basic_data.get('id')
 
         # Check for duplicate
-        if self.db_obj.check_id_exists(listing_id, 'mobile'):
+        if str(listing_id) in existing_ids:
             self.log.info(f"⏭️  Skipping duplicate ID: {listing_id}")
-            self.stats.duplicates_skipped += 1
             return None
 
         try:
@@ -241,37 +318,24 @@ class MobileDeHourlyScraper:
                     basic_data[tag] = attribute.get('value')
 
             # Parse description
-            html_desc = ad_data.get('htmlDescription', '')
-            if html_desc:
-                soup = BeautifulSoup(html_desc, "html.parser")
-                basic_data['description'] = soup.get_text().strip()
-            else:
-                basic_data['description'] = ''
+            basic_data['description'] = _html_to_text(ad_data.get('htmlDescription') or '')
 
             # Parse images
             gallery_images = ad_data.get('galleryImages', [])
             image_urls = []
             for img in gallery_images:
-                if 'srcSet' in img:
-                    src_set = img['srcSet'].split(',')[-1].strip()
-                    url = src_set.split(' ')[0]
-                    image_urls.append(url)
-            basic_data['images'] = json.dumps(image_urls)
+                src_set = img.get('srcSet')
+                if src_set is not None:
+                    # Last (largest) candidate: text after the final comma, up to its width descriptor
+                    image_urls.append(src_set[src_set.rfind(',') + 1:].strip().partition(' ')[0])
+            basic_data['images'] = orjson.dumps(image_urls).decode()
 
-            # Parse features
-            features = ad_data.get('features', [])
-            self.unique_features.update(features)
-
-            for feature in self.unique_features:
-                basic_data[feature] = feature in features
+            # Parse features (kept as a set; process_listings expands them for the whole page)
+            basic_data['_features'] = set(ad_data.get('features', []))
 
             # Apply field mapping
-            for old_key in list(basic_data.keys()):
-                if old_key in self.FIELD_MAPPING:
-                    value = basic_data.pop(old_key)
-                    new_key = self.FIELD_MAPPING[old_key]
-                    if new_key:
-                        basic_data[new_key] = value
+            rename, drop = self._RENAME, self._DROP
+            basic_data = {rename.get(k, k): v for k, v in basic_data.items() if k not in drop}
 
             self.log.info(f"✅ Parsed: {basic_data.get('title', 'Unknown')[:50]} - €{basic_data.get('price', 'N/A')}")
             return basic_data
@@ -281,35 +345,43 @@ class MobileDeHourlyScraper:
             return basic_data
 
     def process_listings(self, listings: List[Dict[str, Any]]):
-        """Process multiple listings using thread pool"""
-        lock = threading.Lock()
+        """Fetch listing details on the run-wide thread pool, then write the whole page in one batch"""
+
+        # One query for the whole page instead of a duplicate check per listing
+        ad_ids = [str(listing.get('id')) for listing in listings if listing.get('type') == 'ad']
+        existing = self.db_obj.existing_ids(ad_ids, 'mobile')
+        self.stats.duplicates_skipped += sum(ad_id in existing for ad_id in ad_ids)
 
         def process_single(listing):
             try:
                 if listing.get('type') != 'ad':
-                    return
+                    return None
 
                 basic_data = self.parse_basic_listing(listing)
-                detailed_data = self.parse_detail_listing(basic_data)
+                detailed_data = self.parse_detail_listing(basic_data, existing)
 
                 if detailed_data:
                     detailed_data['interior_color'] = None
                     detailed_data['interior_type'] = None
-                    final_data = convert_vehicle_data(detailed_data, 'mobile')
-
-                    with lock:
-                        self.db_obj.insert_vehicle(final_data)
-                        self.stats.total_listings += 1
-                        self.stats.list_process_per_page += 1
+                    return detailed_data
 
             except Exception as e:
                 self.log.info(f"❌ Error processing listing: {e}")
+            return None
 
-        with ThreadPoolExecutor(max_workers=self.thread_limit) as executor:
-            futures = [executor.submit(process_single, listing) for listing in listings]
+        futures = [self.executor.submit(process_single, listing) for listing in listings]
+        details = [detailed_data for detailed_data in (future.result() for future in futures) if detailed_data]
 
-            for future in as_completed(futures):
-                future.result()
+        # Expand each listing's feature names into True flags while building the page batch
+        page_rows = []
+        for detailed_data in details:
+            detailed_data.update(dict.fromkeys(detailed_data.pop('_features', ()), True))
+            page_rows.append(convert_vehicle_data(detailed_data, 'mobile'))
+
+        if page_rows:
+            inserted = self.db_obj.insert_vehicles_many(page_rows)
+            self.stats.total_listings += inserted
+            self.stats.list_process_per_page += inserted
 
     def run(self):
         """Main execution method - fetch latest listings sorted by date"""
@@ -320,34 +392,22 @@ class MobileDeHourlyScraper:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.log.info(f"🕐 Run timestamp: {timestamp}")
 
-        url = "https://suchen.mobile.de/fahrzeuge/search.html"
         page_number = 1
+        self.executor = ThreadPoolExecutor(max_workers=self.thread_limit, thread_name_prefix="mobile-detail")
+        self.page_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mobile-page")
+        next_page = self.page_executor.submit(self.get_search_response, self._page_url(page_number))
 
         try:
             while page_number < self.config.max_pages:
                 self.log.info(f"\n{'=' * 60}")
                 self.log.info(f"📖 Processing page {page_number}")
 
-                # Build search parameters
-                params = {
-                    "dam": "false",
-                    "isSearchRequest": "true",
-                    "od": "down",
-                    "pageNumber": str(page_number),
-                    "ref": "srpNextPage",
-                    "s": "Car",
-                    "sb": "doc",  # Sort by date
-                    "vc": "Car"
-                }
-
-                response = self.get_search_response(url, params)
-
-                if not response or 'search' not in response:
+                search_results = next_page.result()
+
+                if not search_results:
                     self.log.info(f"❌ Failed to get response for page {page_number}")
                     break
 
-                # Get search results
-                search_results = response.get('search', {}).get('srp', {}).get('data', {}).get('searchResults', {})
                 num_results = search_results.get('numResultsTotal', 0)
                 num_pages = search_results.get('numPages', 0)
 
@@ -364,6 +424,10 @@ class MobileDeHourlyScraper:
 
                 self.log.info(f"🔄 Processing {len(listings)} listings from this page")
 
+                # Fetch the next search page in the background while this one is processed
+                if page_number < num_pages and page_number + 1 < self.config.max_pages:
+                    next_page = self.page_executor.submit(self.get_search_response, self._page_url(page_number + 1))
+
                 # Process listings
                 self.process_listings(listings)
 
@@ -386,14 +450,19 @@ class MobileDeHourlyScraper:
                     break
                 page_number += 1
 
-                # Add small delay between pages
-                time.sleep(self.config.delay_between_requests)
-
         except KeyboardInterrupt:
             self.log.info("\n\n⚠️  Scraping interrupted by user")
         except Exception as e:
             self.log.info(f"❌ Error during scraping: {str(e)[:200]}")
-
+        finally:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+            # A prefetched page that is not needed anymore is cancelled
+            self.page_executor.shutdown(wait=False, cancel_futures=True)
+            self.page_executor = None
+            self.session.close()
+
+        self.db_obj.flush()
         elapsed_time = time.time() - start_time
 
         # self.log.info final statistics
@@ -417,7 +486,6 @@ def main():
     config = ScraperConfig(
         max_pages=50,
         max_retries=5,
-        delay_between_requests=.1,
     )
 
     # Initialize and run scraper